@@ -1,7 +1,23 @@
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import argparse
+import ctypes
+import mmap
+import os
+import re
+import struct
 import sys
+import time
+import zlib
+
+try:
+    import resource
+except ImportError:  # Windows tidak punya modul resource
+    resource = None
 
 # Variabel rotasi
 rotate_x = 0
@@ -12,6 +28,35 @@ translate_x = 0.0
 translate_y = 0.0
 translate_z = -5.0
 
+# Mesh OBJ yang dimuat (None = tampilkan kubus bawaan)
+mesh = None
+mesh_buffers = None
+
+# Parser OBJ
+# Ukuran chunk baca (byte). Setiap chunk disalin dari mmap lalu dipecah regex
+# menjadi banyak objek bytes kecil, jadi puncak memori ikut ukuran chunk:
+# chunk beberapa MiB menjaga memori mendekati ukuran mesh akhir tanpa
+# memperlambat parsing (chunk 64 MiB justru lebih lambat dan ~3x lebih boros).
+OBJ_CHUNK_SIZE = 4 * 1024 * 1024
+OBJ_CACHE_VERSION = 2
+# Komentar '#' di akhir baris tidak ikut diambil
+OBJ_VERTEX_RE = re.compile(rb'^v[ \t]+([^#\r\n]*)', re.M)
+OBJ_NORMAL_RE = re.compile(rb'^vn[ \t]+([^#\r\n]*)', re.M)
+OBJ_FACE_RE = re.compile(rb'^f[ \t]+([^#\r\n]*)', re.M)
+OBJ_CONTINUATION_RE = re.compile(rb'\\\r?\n')
+# Pola token face per format; dipakai untuk memastikan satu chunk memakai satu format
+OBJ_FACE_TOKEN_PATTERNS = {
+    (0, False): rb'-?\d+',
+    (1, False): rb'-?\d+/-?\d+',
+    (2, True): rb'-?\d+//-?\d+',
+    (2, False): rb'-?\d+/-?\d+/-?\d+',
+}
+
+# Capture offscreen
+CAPTURE_WIDTH = 800
+CAPTURE_HEIGHT = 600
+CAPTURE_PBO_COUNT = 3  # Jumlah PBO dalam ring (setiap PBO di-map CAPTURE_PBO_COUNT frame kemudian)
+
 def init():
     glClearColor(0.1, 0.1, 0.1, 1.0)  # Warna latar belakang
     glEnable(GL_DEPTH_TEST)           # Aktifkan depth buffer
@@ -82,7 +127,281 @@ def draw_cube():
     glEnd()
 
 
-def display():
+def parse_obj_floats(lines, width):
+    """Ubah baris 'v'/'vn' menjadi array (N, width) float32"""
+    if not lines:
+        return np.empty((0, width), dtype=np.float32)
+    try:
+        values = np.fromstring(b' '.join(lines), dtype=np.float32, sep=' ')
+    except ValueError:
+        values = None
+    if values is not None and values.size == len(lines) * width:
+        return values.reshape(-1, width)
+    # Ada komponen tambahan (w, warna vertex) atau token aneh: parse per baris
+    rows = [line.split()[:width] for line in lines]
+    for line, row in zip(lines, rows):
+        if len(row) < width:
+            raise ValueError(f"Invalid OBJ line: {line!r}")
+    return np.array(rows, dtype=np.float32)
+
+
+def parse_obj_faces(lines):
+    """
+    Ubah baris 'f' menjadi (jumlah vertex per face, indeks vertex, indeks normal).
+    Jalur cepat dipakai jika semua token memakai format (v, v/vt, v//vn, v/vt/vn)
+    yang sama dengan token pertama; selain itu parse per baris.
+    """
+    counts = np.fromiter(map(len, map(bytes.split, lines)), dtype=np.int64, count=len(lines))
+    first = lines[0].split()[0] if counts[0] else b''
+    double_slash = b'//' in first
+    token = OBJ_FACE_TOKEN_PATTERNS.get((first.count(b'/'), double_slash))
+    data = b' '.join(lines)
+    if token is None or not re.fullmatch(rb'[ \t]*%s(?:[ \t]+%s)*[ \t]*' % (token, token), data):
+        return parse_obj_faces_per_line(lines, counts)
+
+    stride = 1 + first.count(b'/') - (1 if double_slash else 0)
+    refs = np.fromstring(data.replace(b'//', b' ').replace(b'/', b' '), dtype=np.int64, sep=' ')
+    if refs.size != counts.sum() * stride:
+        raise ValueError("OBJ face indices do not match face token counts")
+    refs = refs.reshape(-1, stride)
+    has_normal = first.count(b'/') == 2
+    normal_refs = refs[:, -1] if has_normal else None
+    return counts, refs[:, 0], normal_refs
+
+
+def parse_obj_faces_per_line(lines, counts):
+    """Parse baris 'f' satu per satu (format token boleh campur)"""
+    vertex_refs = []
+    normal_refs = []
+    for line in lines:
+        for token in line.split():
+            parts = token.split(b'/')
+            try:
+                vertex_refs.append(int(parts[0]))
+                normal_refs.append(int(parts[2]) if len(parts) > 2 and parts[2] else None)
+            except ValueError:
+                raise ValueError(f"Invalid OBJ face line: {line!r}") from None
+    # Indeks normal hanya dipakai jika setiap vertex face memilikinya
+    if None in normal_refs:
+        normal_refs = None
+    else:
+        normal_refs = np.array(normal_refs, dtype=np.int64)
+    return counts, np.array(vertex_refs, dtype=np.int64), normal_refs
+
+
+def resolve_obj_indices(refs, counts, defined_before):
+    """Ubah indeks OBJ (mulai dari 1, boleh negatif) menjadi indeks mulai dari 0"""
+    if (refs < 0).any():
+        # Indeks negatif relatif terhadap jumlah elemen yang sudah didefinisikan
+        refs = np.where(refs < 0, refs + np.repeat(defined_before, counts), refs - 1)
+    else:
+        refs = refs - 1
+    return refs
+
+
+def triangulate_faces(counts, refs):
+    """Pecah polygon menjadi segitiga (triangle fan), hasil (T, 3)"""
+    starts = np.cumsum(counts) - counts
+    triangles = []
+    for count in np.unique(counts):
+        if count < 3:
+            continue
+        base = starts[counts == count]
+        fan = np.arange(1, count - 1)
+        corners = np.stack([np.broadcast_to(base[:, None], (len(base), len(fan))),
+                            base[:, None] + fan,
+                            base[:, None] + fan + 1], axis=-1).reshape(-1, 3)
+        triangles.append(refs[corners])
+    if not triangles:
+        return np.empty((0, 3), dtype=refs.dtype)
+    return np.concatenate(triangles)
+
+
+def compute_vertex_normals(vertices, indices):
+    """Normal per vertex: rata-rata normal face (berbobot luas) di sekitarnya"""
+    tri = vertices[indices]
+    face_normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    normals = np.zeros_like(vertices)
+    for corner in range(3):
+        np.add.at(normals, indices[:, corner], face_normals)
+    length = np.linalg.norm(normals, axis=1, keepdims=True)
+    return normals / np.where(length > 0, length, 1.0)
+
+
+def parse_obj(path):
+    """
+    Parse file Wavefront OBJ menggunakan mmap dan dibaca per chunk.
+    Hasil: dict berisi 'vertices', 'normals' (float32, (N, 3)) dan
+    'indices' (uint32, (T, 3)).
+    """
+    vertex_chunks, normal_chunks = [], []
+    count_chunks, vertex_ref_chunks, normal_ref_chunks = [], [], []
+    vertex_total = normal_total = 0
+    has_normal_refs = True
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        size = len(data)
+        start = 0
+        while start < size:
+            # Potong chunk tepat di akhir baris
+            end = min(start + OBJ_CHUNK_SIZE, size)
+            if end < size:
+                newline = data.find(b'\n', end)
+                # Baris yang diakhiri '\\' berlanjut ke baris berikutnya
+                while newline != -1 and data[max(newline - 2, 0):newline].rstrip(b'\r').endswith(b'\\'):
+                    newline = data.find(b'\n', newline + 1)
+                end = size if newline == -1 else newline + 1
+            chunk = data[start:end]
+            start = end
+            if b'\\' in chunk:
+                chunk = OBJ_CONTINUATION_RE.sub(b' ', chunk)
+
+            vertices = parse_obj_floats(OBJ_VERTEX_RE.findall(chunk), 3)
+            normals = parse_obj_floats(OBJ_NORMAL_RE.findall(chunk), 3)
+            faces = OBJ_FACE_RE.findall(chunk)
+
+            if faces:
+                counts, vertex_refs, normal_refs = parse_obj_faces(faces)
+                # Jumlah v/vn sebelum setiap face, untuk indeks negatif
+                vertex_before = normal_before = vertex_total
+                if (vertex_refs < 0).any() or (normal_refs is not None and (normal_refs < 0).any()):
+                    face_pos = [m.start() for m in OBJ_FACE_RE.finditer(chunk)]
+                    vertex_pos = [m.start() for m in OBJ_VERTEX_RE.finditer(chunk)]
+                    normal_pos = [m.start() for m in OBJ_NORMAL_RE.finditer(chunk)]
+                    vertex_before = vertex_total + np.searchsorted(vertex_pos, face_pos)
+                    normal_before = normal_total + np.searchsorted(normal_pos, face_pos)
+                count_chunks.append(counts)
+                vertex_ref_chunks.append(resolve_obj_indices(vertex_refs, counts, vertex_before))
+                if normal_refs is None:
+                    has_normal_refs = False
+                else:
+                    normal_ref_chunks.append(resolve_obj_indices(normal_refs, counts, normal_before))
+
+            vertex_chunks.append(vertices)
+            normal_chunks.append(normals)
+            vertex_total += len(vertices)
+            normal_total += len(normals)
+
+    vertices = np.concatenate(vertex_chunks)
+    normals = np.concatenate(normal_chunks)
+    if not count_chunks:
+        raise ValueError(f"{path}: tidak ada face")
+    counts = np.concatenate(count_chunks)
+    vertex_refs = np.concatenate(vertex_ref_chunks)
+
+    if has_normal_refs and normal_total > 0:
+        # Satu indeks GL per pasangan (vertex, normal) yang unik
+        normal_refs = np.concatenate(normal_ref_chunks)
+        pairs, corner_index = np.unique(np.stack([vertex_refs, normal_refs], axis=1),
+                                        axis=0, return_inverse=True)
+        indices = triangulate_faces(counts, corner_index.reshape(-1))
+        vertices, normals = vertices[pairs[:, 0]], normals[pairs[:, 1]]
+    else:
+        indices = triangulate_faces(counts, vertex_refs)
+        normals = compute_vertex_normals(vertices, indices)
+
+    return {
+        'vertices': np.ascontiguousarray(vertices, dtype=np.float32),
+        'normals': np.ascontiguousarray(normals, dtype=np.float32),
+        'indices': np.ascontiguousarray(indices, dtype=np.uint32),
+    }
+
+
+def load_obj(path):
+    """
+    Muat mesh OBJ. Hasil parse disimpan di file cache '<path>.npz' di samping
+    file OBJ, dan dipakai lagi selama ukuran/waktu modifikasi OBJ tidak berubah.
+    """
+    start = time.perf_counter()
+    stat = os.stat(path)
+    cache_path = path + '.npz'
+    source_key = np.array([OBJ_CACHE_VERSION, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    loaded = None
+    if os.path.exists(cache_path):
+        try:
+            with np.load(cache_path) as cache:
+                if np.array_equal(cache['source_key'], source_key):
+                    loaded = {name: cache[name] for name in ('vertices', 'normals', 'indices')}
+        except Exception as e:
+            # Cache rusak/terpotong dianggap tidak ada, akan ditulis ulang
+            print(f"Ignoring unreadable mesh cache {cache_path}: {e}")
+            loaded = None
+
+    from_cache = loaded is not None
+    if not from_cache:
+        loaded = parse_obj(path)
+        # Tulis ke file sementara lalu os.replace, agar cache tidak pernah setengah jadi
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                np.savez(f, source_key=source_key, **loaded)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Could not write mesh cache {cache_path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    elapsed = time.perf_counter() - start
+    mesh_bytes = sum(array.nbytes for array in loaded.values())
+    print(f"Loaded {path} ({'cache' if from_cache else 'parsed'}) in {elapsed:.2f} s: "
+          f"{len(loaded['vertices'])} vertices, {len(loaded['indices'])} triangles, "
+          f"{mesh_bytes / 2**20:.1f} MiB mesh data")
+    if resource is not None:
+        # ru_maxrss dalam KiB di Linux
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"Peak memory: {peak / 1024:.1f} MiB")
+
+    # Pusat dan skala supaya mesh seukuran kubus bawaan (sisi 2)
+    low, high = loaded['vertices'].min(axis=0), loaded['vertices'].max(axis=0)
+    extent = float((high - low).max())
+    loaded['center'] = (low + high) / 2
+    loaded['scale'] = 2.0 / extent if extent > 0 else 1.0
+    return loaded
+
+
+def upload_mesh(mesh):
+    """Upload mesh sekali ke VBO (vertex, normal) dan index buffer"""
+    vertex_buffer, normal_buffer, index_buffer = glGenBuffers(3)
+    glBindBuffer(GL_ARRAY_BUFFER, vertex_buffer)
+    glBufferData(GL_ARRAY_BUFFER, mesh['vertices'].nbytes, mesh['vertices'], GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, normal_buffer)
+    glBufferData(GL_ARRAY_BUFFER, mesh['normals'].nbytes, mesh['normals'], GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, index_buffer)
+    glBufferData(GL_ELEMENT_ARRAY_BUFFER, mesh['indices'].nbytes, mesh['indices'], GL_STATIC_DRAW)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+    return {
+        'vertex': vertex_buffer,
+        'normal': normal_buffer,
+        'index': index_buffer,
+        'count': mesh['indices'].size,
+    }
+
+
+def draw_mesh():
+    """Gambar mesh dari VBO dengan glDrawElements"""
+    glPushMatrix()
+    glScalef(mesh['scale'], mesh['scale'], mesh['scale'])
+    glTranslatef(*(-mesh['center']))
+
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_NORMAL_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, mesh_buffers['vertex'])
+    glVertexPointer(3, GL_FLOAT, 0, None)
+    glBindBuffer(GL_ARRAY_BUFFER, mesh_buffers['normal'])
+    glNormalPointer(GL_FLOAT, 0, None)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, mesh_buffers['index'])
+    glDrawElements(GL_TRIANGLES, mesh_buffers['count'], GL_UNSIGNED_INT, None)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    glDisableClientState(GL_NORMAL_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+    glPopMatrix()
+
+
+def draw_scene():
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
     glLoadIdentity()
 
@@ -96,10 +415,148 @@ def display():
     glRotatef(rotate_x, 1, 0, 0)
     glRotatef(rotate_y, 0, 1, 0)
 
-    draw_cube()
+    if mesh_buffers is not None:
+        draw_mesh()
+    else:
+        draw_cube()
+
+
+def display():
+    draw_scene()
     glutSwapBuffers()
 
 
+def write_png(path, pixels):
+    """Tulis array (H, W, 4) uint8 sebagai PNG RGBA (hanya pakai zlib)"""
+    height, width = pixels.shape[:2]
+    # Setiap baris diawali byte filter 0 (None)
+    raw = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    raw[:, 1:] = pixels.reshape(height, -1)
+
+    def chunk(tag, data):
+        crc = zlib.crc32(tag + data) & 0xffffffff
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', crc)
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(raw.tobytes(), 1)))
+        f.write(chunk(b'IEND', b''))
+
+
+def save_frame(path, data, width, height):
+    """Dijalankan di worker: balik baris (glReadPixels mulai dari bawah) lalu simpan"""
+    pixels = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4)[::-1]
+    write_png(path, pixels)
+
+
+def create_capture_target(width, height, pbo_count):
+    """Buat FBO (color + depth renderbuffer) dan ring PBO untuk readback"""
+    fbo = glGenFramebuffers(1)
+    color, depth = glGenRenderbuffers(2)
+    glBindRenderbuffer(GL_RENDERBUFFER, color)
+    glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, width, height)
+    glBindRenderbuffer(GL_RENDERBUFFER, depth)
+    glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, width, height)
+    glBindRenderbuffer(GL_RENDERBUFFER, 0)
+
+    glBindFramebuffer(GL_FRAMEBUFFER, fbo)
+    glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, color)
+    glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, depth)
+    status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+    glBindFramebuffer(GL_FRAMEBUFFER, 0)
+    if status != GL_FRAMEBUFFER_COMPLETE:
+        raise RuntimeError(f"Framebuffer incomplete: 0x{status:x}")
+
+    frame_bytes = width * height * 4
+    pbos = [int(pbo) for pbo in np.atleast_1d(glGenBuffers(pbo_count))]
+    for pbo in pbos:
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+        glBufferData(GL_PIXEL_PACK_BUFFER, frame_bytes, None, GL_STREAM_READ)
+    glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+    return {
+        'fbo': fbo,
+        'renderbuffers': (color, depth),
+        'pbos': pbos,
+        'width': width,
+        'height': height,
+        'frame_bytes': frame_bytes,
+    }
+
+
+def read_pbo(target, pbo):
+    """Map PBO yang sudah terisi dan salin isinya ke bytes"""
+    glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+    pointer = glMapBufferRange(GL_PIXEL_PACK_BUFFER, 0, target['frame_bytes'], GL_MAP_READ_BIT)
+    data = ctypes.string_at(pointer, target['frame_bytes'])
+    glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+    glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+    return data
+
+
+def run_capture(output_dir, frames, step_x, step_y, workers):
+    """
+    Sweep rotate_x/rotate_y tanpa interaksi dan simpan setiap frame sebagai PNG.
+    Scene dirender ke FBO, lalu glReadPixels mengisi ring PBO secara asinkron.
+    PBO baru di-map CAPTURE_PBO_COUNT frame kemudian, sehingga transfer
+    tumpang tindih dengan render frame berikutnya. Encoding PNG dan penulisan
+    file dikerjakan thread pool.
+    """
+    global rotate_x, rotate_y
+    os.makedirs(output_dir, exist_ok=True)
+    target = create_capture_target(CAPTURE_WIDTH, CAPTURE_HEIGHT, CAPTURE_PBO_COUNT)
+    width, height = target['width'], target['height']
+    ring = target['pbos']
+    ring_frames = [None] * len(ring)  # Nomor frame yang sedang ada di setiap PBO
+    pending = deque()
+
+    glBindFramebuffer(GL_FRAMEBUFFER, target['fbo'])
+    reshape(width, height)
+    glPixelStorei(GL_PACK_ALIGNMENT, 1)
+
+    def collect(pool, slot):
+        data = read_pbo(target, ring[slot])
+        path = os.path.join(output_dir, f"frame_{ring_frames[slot]:05d}.png")
+        pending.append(pool.submit(save_frame, path, data, width, height))
+        ring_frames[slot] = None
+        # Batasi antrian agar memori tidak terus bertambah saat encoding lebih lambat
+        while len(pending) > 2 * workers:
+            pending.popleft().result()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for frame in range(frames):
+            slot = frame % len(ring)
+            if ring_frames[slot] is not None:
+                collect(pool, slot)
+
+            draw_scene()
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, ring[slot])
+            glReadPixels(0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+            ring_frames[slot] = frame
+
+            rotate_x += step_x
+            rotate_y += step_y
+
+        # Ambil sisa frame di ring sesuai urutan
+        for frame in range(max(frames - len(ring), 0), frames):
+            collect(pool, frame % len(ring))
+        while pending:
+            pending.popleft().result()
+    elapsed = time.perf_counter() - start
+
+    glBindFramebuffer(GL_FRAMEBUFFER, 0)
+    glDeleteBuffers(len(ring), ring)
+    glDeleteRenderbuffers(2, target['renderbuffers'])
+    glDeleteFramebuffers(1, [target['fbo']])
+
+    fps = frames / elapsed if elapsed > 0 else 0.0
+    print(f"Captured {frames} frames ({width}x{height}) to {output_dir} "
+          f"in {elapsed:.2f} s: {fps:.1f} fps sustained")
+    return fps
+
+
 def reshape(width, height):
     glViewport(0, 0, width, height)
     glMatrixMode(GL_PROJECTION)
@@ -140,11 +597,40 @@ def special_input(key, x, y):
 
 
 def main():
-    glutInit(sys.argv)
+    global mesh, mesh_buffers
+    parser = argparse.ArgumentParser(description="3D viewer dengan pencahayaan - PyOpenGL")
+    parser.add_argument('obj', nargs='?', help="file Wavefront OBJ (default: kubus)")
+    parser.add_argument('--capture', metavar='DIR',
+                        help="render offscreen dan simpan frame PNG ke DIR, lalu keluar")
+    parser.add_argument('--frames', type=int, default=360, help="jumlah frame capture")
+    parser.add_argument('--step-x', type=float, default=0.0, help="perubahan rotate_x per frame")
+    parser.add_argument('--step-y', type=float, default=1.0, help="perubahan rotate_y per frame")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4,
+                        help="jumlah thread encoder PNG")
+    args, glut_args = parser.parse_known_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.frames < 0:
+        parser.error("--frames must not be negative")
+
+    if args.obj:
+        mesh = load_obj(args.obj)
+
+    glutInit([sys.argv[0]] + glut_args)
     glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB | GLUT_DEPTH)
     glutInitWindowSize(800, 600)
     glutCreateWindow(b"3D Object with Lighting and Camera - PyOpenGL")
     init()
+    if mesh is not None:
+        # Skala mesh mengubah panjang normal, normalisasi ulang untuk pencahayaan
+        glEnable(GL_NORMALIZE)
+        mesh_buffers = upload_mesh(mesh)
+
+    if args.capture:
+        glutHideWindow()
+        run_capture(args.capture, args.frames, args.step_x, args.step_y, args.workers)
+        return
+
     glutDisplayFunc(display)
     glutReshapeFunc(reshape)
     glutKeyboardFunc(keyboard)
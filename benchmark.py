@@ -0,0 +1,452 @@
+"""
+Benchmark untuk main6.py dengan scene sintetis (seed tetap).
+
+Contoh:
+    python benchmark.py                                  # semua ukuran, tulis bench_results.json
+    python benchmark.py --sizes 1000,10000 --no-render
+    python benchmark.py --save-baseline bench_baseline.json
+    python benchmark.py --baseline bench_baseline.json --threshold 0.15 --noise-factor 3
+
+Render memakai konteks OpenGL software (Mesa llvmpipe lewat EGL surfaceless),
+sehingga bisa dijalankan tanpa GPU maupun display.
+Setiap pengukuran diulang sampai minimal --min-time detik (seperti
+timeit.autorange). Sebelum setiap kasus diukur juga beban referensi tetap, dan
+waktu kasus dibandingkan relatif terhadap referensi itu supaya mesin yang sedang
+lambat (CPU dipakai proses lain) tidak terbaca sebagai regresi. Sebuah kasus
+dianggap regresi jika lebih lambat dari baseline melebihi --threshold (relatif)
+dan melebihi noise-nya (--noise-factor kali selisih antar pengulangan, minimal
+--min-delta) setelah diukur ulang --confirm kali; exit code 1 jika ada.
+"""
+import argparse
+import contextlib
+import ctypes
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+OBJECT_TYPES = ['point', 'line', 'rectangle', 'ellipse']
+TRANSFORMED_FRACTION = 0.5  # Porsi objek yang diberi transformasi acak
+CLICK_COUNT = 5             # Jumlah klik per pengukuran find_object_at_point
+DELETE_COUNT = 20           # Jumlah DELETE per pengukuran delete churn
+MIN_MEASURE_TIME = 0.2      # Durasi minimum satu pengukuran (detik)
+MIN_DELTA = 0.0001          # Selisih absolut minimum agar dianggap regresi (resolusi timer, detik)
+NOISE_FACTOR = 3.0          # Selisih harus > NOISE_FACTOR x spread antar pengulangan
+REFERENCE_TIME = 0.05       # Durasi minimum pengukuran beban referensi (detik)
+
+
+def generate_scene(size, seed, width=800, height=600):
+    """
+    Buat scene acak: objek campuran, transformasi acak, dan window clipping.
+    Format objek dan transformasi sama dengan yang dibuat GraphicsApp.
+    """
+    rng = np.random.default_rng([seed, size])
+    types = rng.choice(OBJECT_TYPES, size=size)
+    # Sebagian objek sengaja berada di luar layar agar clipping ikut bekerja
+    starts = rng.uniform((-0.25 * width, -0.25 * height), (1.25 * width, 1.25 * height), (size, 2))
+    ends = starts + rng.normal(0, 60, (size, 2))
+    colors = rng.random((size, 3))
+    widths = rng.integers(1, 6, size)
+
+    objects = []
+    for obj_type, start, end, color, line_width in zip(
+            types.tolist(), starts.tolist(), ends.tolist(), colors.tolist(), widths.tolist()):
+        points = [tuple(start)] if obj_type == 'point' else [tuple(start), tuple(end)]
+        objects.append({
+            'type': obj_type,
+            'points': points,
+            'color': color,
+            'width': float(line_width)
+        })
+
+    transformed = np.flatnonzero(rng.random(size) < TRANSFORMED_FRACTION)
+    translations = rng.uniform(-100, 100, (len(transformed), 2))
+    rotations = rng.uniform(-180, 180, len(transformed))
+    scales = rng.uniform(0.5, 2.0, len(transformed))
+    object_transformations = {
+        obj_idx: {
+            'translation': translation,
+            'rotation': rotation,
+            'scale': scale
+        }
+        for obj_idx, translation, rotation, scale in zip(
+            transformed.tolist(), translations.tolist(), rotations.tolist(), scales.tolist())
+    }
+
+    x1, x2 = sorted(rng.uniform(0, width, 2))
+    y1, y2 = sorted(rng.uniform(0, height, 2))
+    window_bounds = [x1, y1, max(x2, x1 + 50), max(y2, y1 + 50)]
+
+    clicks = rng.uniform((0, 0), (width, height), (CLICK_COUNT, 2)).tolist()
+    deletes = rng.integers(0, size - DELETE_COUNT, DELETE_COUNT).tolist()
+    return {
+        'objects': objects,
+        'object_transformations': object_transformations,
+        'window_bounds': window_bounds,
+        'clicks': clicks,
+        'deletes': deletes,
+    }
+
+
+def load_scene(app, scene):
+    """Pasang scene ke app (salinan dangkal agar scene bisa dipakai ulang)"""
+    app.objects = list(scene['objects'])
+    app.object_transformations = dict(scene['object_transformations'])
+    app.window_bounds = list(scene['window_bounds'])
+    app.selected_object = None
+    app.temp_points = []
+
+
+def measure(func, repeat, setup=None, min_time=MIN_MEASURE_TIME):
+    """
+    Ukur durasi satu pemanggilan func. Seperti timeit.autorange, jumlah
+    pemanggilan per pengukuran digandakan sampai totalnya >= min_time
+    (putaran kalibrasi sekaligus jadi warm-up). setup dijalankan sebelum
+    setiap pemanggilan dan tidak ikut diukur.
+    Hasil: (rata-rata per pemanggilan untuk setiap pengukuran,
+            pemanggilan tercepat untuk setiap pengukuran,
+            jumlah pemanggilan per pengukuran)
+    Pemanggilan tercepat dipakai untuk perbandingan baseline karena paling
+    sedikit terganggu proses lain (saran yang sama dengan dokumentasi timeit).
+    """
+    def run(number):
+        total = 0.0
+        fastest = float('inf')
+        for _ in range(number):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            total += elapsed
+            fastest = min(fastest, elapsed)
+        return total, fastest
+
+    number = 1
+    while run(number)[0] < min_time:
+        number *= 2
+    runs = [run(number) for _ in range(repeat)]
+    return [total / number for total, _ in runs], [fastest for _, fastest in runs], number
+
+
+def reference_workload():
+    """Beban tetap (loop Python + numpy) untuk mengukur kecepatan mesin saat ini"""
+    values = np.arange(20000, dtype=float)
+    total = 0.0
+    for i in range(2000):
+        total += i * 0.5
+    return total + float(np.sqrt(values * values + 1.0).sum())
+
+
+def create_software_context(width, height):
+    """Buat konteks OpenGL software (EGL pbuffer) dan jadikan current"""
+    from OpenGL import EGL
+
+    display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+    major, minor = EGL.EGLint(), EGL.EGLint()
+    if not EGL.eglInitialize(display, ctypes.pointer(major), ctypes.pointer(minor)):
+        raise RuntimeError("eglInitialize failed")
+
+    config_attribs = (EGL.EGLint * 9)(
+        EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+        EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+        EGL.EGL_RED_SIZE, 8,
+        EGL.EGL_DEPTH_SIZE, 0,
+        EGL.EGL_NONE)
+    config = EGL.EGLConfig()
+    config_count = EGL.EGLint()
+    if not EGL.eglChooseConfig(display, config_attribs, ctypes.pointer(config), 1,
+                               ctypes.pointer(config_count)) or config_count.value == 0:
+        raise RuntimeError("No EGL config with desktop OpenGL support")
+
+    surface = EGL.eglCreatePbufferSurface(
+        display, config, (EGL.EGLint * 5)(EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE))
+    EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+    context = EGL.eglCreateContext(display, config, EGL.EGL_NO_CONTEXT, None)
+    if not EGL.eglMakeCurrent(display, surface, surface, context):
+        raise RuntimeError("eglMakeCurrent failed")
+    return display, surface, context
+
+
+# Setiap bench_* menyiapkan scene dan mengembalikan (run, jumlah operasi, setup)
+
+def bench_transform(main6, app, scene):
+    load_scene(app, scene)
+    objects = app.objects
+
+    def run():
+        for i, obj in enumerate(objects):
+            app.apply_transformation_to_object(obj, i)
+    return run, len(objects), None
+
+
+def bench_clip(main6, app, scene):
+    load_scene(app, scene)
+    xmin, ymin, xmax, ymax = app.window_bounds
+    segments = []
+    for i, obj in enumerate(app.objects):
+        if obj['type'] != 'point':
+            (x1, y1), (x2, y2) = app.apply_transformation_to_object(obj, i)
+            segments.append((x1, y1, x2, y2))
+
+    def run():
+        for x1, y1, x2, y2 in segments:
+            app.cohen_sutherland_clip(x1, y1, x2, y2, xmin, ymin, xmax, ymax)
+    return run, len(segments), None
+
+
+def bench_pick(main6, app, scene):
+    load_scene(app, scene)
+    clicks = scene['clicks']
+
+    def run():
+        for x, y in clicks:
+            app.find_object_at_point(x, y)
+    return run, len(clicks), None
+
+
+def bench_render(main6, app, scene):
+    from OpenGL.GL import glFinish
+
+    load_scene(app, scene)
+    app.selected_object = len(app.objects) // 2
+    snapshot = main6.SceneSnapshot(app)
+
+    def run():
+        app.draw_scene(snapshot)
+        glFinish()
+    return run, 1, None
+
+
+def bench_delete(main6, app, scene):
+    from pygame.locals import K_DELETE
+
+    deletes = scene['deletes']
+
+    def setup():
+        # Cache geometri dan snapshot disiapkan seperti di aplikasi, supaya
+        # DELETE melewati delete_geometry dan bukan rebuild penuh
+        load_scene(app, scene)
+        app.get_transformed_geometry()
+        app.publish_snapshot()
+
+    def run():
+        # handle_keyboard mencetak pesan untuk setiap DELETE
+        with contextlib.redirect_stdout(io.StringIO()):
+            for obj_idx in deletes:
+                app.selected_object = obj_idx
+                app.handle_keyboard(K_DELETE)
+                # Thread update menerbitkan snapshot setelah setiap batch event
+                app.publish_snapshot()
+    return run, len(deletes), setup
+
+
+CASES = [
+    ('apply_transformation_to_object', bench_transform),
+    ('cohen_sutherland_clip', bench_clip),
+    ('find_object_at_point', bench_pick),
+    ('render', bench_render),
+    ('delete_churn', bench_delete),
+]
+CASE_FUNCS = dict(CASES)
+
+
+def compare(results, baseline, threshold, noise_factor, min_delta, keys=None):
+    """
+    Bandingkan waktu terbaik dengan baseline (hanya kasus di keys jika diberikan).
+    Hasil: (kasus yang regresi, kasus baseline yang tidak ada di hasil)
+    """
+    regressions = []
+    baseline_results = baseline.get('results', {})
+    for key in (results if keys is None else keys):
+        result = results[key]
+        previous = baseline_results.get(key)
+        if previous is None:
+            print(f"  {key:45s} {'':>11s}    {result['best_s']:10.4f}s          new")
+            continue
+        # Waktu baseline disesuaikan dengan kecepatan mesin saat kedua hasil diukur
+        speed = result['reference_s'] / previous['reference_s'] if previous.get('reference_s') else 1.0
+        expected = previous['best_s'] * speed
+        delta = result['best_s'] - expected
+        ratio = result['best_s'] / expected if expected > 0 else 1.0
+        # Selisih yang tidak melebihi spread antar pengulangan dianggap noise
+        spread = max(previous.get('spread_s', 0.0) * speed, result['spread_s'])
+        regressed = ratio > 1 + threshold and delta > max(min_delta, noise_factor * spread)
+        status = 'REGRESSION' if regressed else 'ok'
+        print(f"  {key:45s} {expected:10.4f}s -> {result['best_s']:10.4f}s "
+              f"({(ratio - 1) * 100:+6.1f}%) {status}")
+        if regressed:
+            regressions.append(key)
+
+    missing = [key for key in baseline_results if key not in results] if keys is None else []
+    for key in missing:
+        print(f"  {key:45s} {baseline_results[key]['best_s']:10.4f}s -> {'':>11s}          MISSING")
+    return regressions, missing
+
+
+def run_case(main6, app, name, size, scene, args):
+    """Jalankan satu kasus benchmark, hasil: dict untuk JSON"""
+    run, ops, setup = CASE_FUNCS[name](main6, app, scene)
+    _, reference, _ = measure(reference_workload, args.repeat, min_time=REFERENCE_TIME)
+    averages, fastest, number = measure(run, args.repeat, setup, args.min_time)
+    best = min(fastest)
+    result = {
+        'case': name,
+        'size': size,
+        'ops': ops,
+        'repeat': args.repeat,
+        'number': number,
+        'best_s': best,
+        'median_s': statistics.median(averages),
+        'per_op_s': best / ops if ops else best,
+        # Selisih pemanggilan tercepat antar pengulangan (median, agar satu
+        # pengulangan yang terganggu tidak mendominasi), perkiraan noise best_s
+        'spread_s': statistics.median(fastest) - best,
+        'reference_s': min(reference),
+    }
+    print(f"{name}[{size}]".ljust(45) + f" best {best:10.4f}s  median {result['median_s']:10.4f}s  "
+          f"({ops} ops, {number} loops)")
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark main6.py dengan scene sintetis")
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help="ukuran scene, dipisah koma (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0, help="seed generator scene")
+    parser.add_argument('--repeat', type=int, default=5, help="jumlah pengukuran per kasus")
+    parser.add_argument('--min-time', type=float, default=MIN_MEASURE_TIME,
+                        help="durasi minimum satu pengukuran dalam detik (default: %(default)s)")
+    parser.add_argument('--cases', default=','.join(name for name, _ in CASES),
+                        help="kasus yang dijalankan, dipisah koma")
+    parser.add_argument('--render-max-size', type=int, default=10000,
+                        help="ukuran scene terbesar untuk benchmark render (immediate mode lambat)")
+    parser.add_argument('--no-render', action='store_true', help="lewati benchmark render")
+    parser.add_argument('--output', default='bench_results.json', help="file hasil JSON")
+    parser.add_argument('--baseline', help="file JSON baseline untuk dibandingkan")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="batas regresi relatif terhadap baseline (default: %(default)s)")
+    parser.add_argument('--noise-factor', type=float, default=NOISE_FACTOR,
+                        help="selisih harus melebihi faktor ini x spread antar pengulangan (default: %(default)s)")
+    parser.add_argument('--min-delta', type=float, default=MIN_DELTA,
+                        help="selisih absolut minimum (detik) agar dianggap regresi (default: %(default)s)")
+    parser.add_argument('--confirm', type=int, default=2,
+                        help="berapa kali kasus yang tampak regresi diukur ulang (default: %(default)s)")
+    parser.add_argument('--save-baseline', metavar='FILE', help="simpan hasil juga sebagai baseline")
+    args = parser.parse_args(argv)
+    try:
+        args.sizes = [int(size) for size in args.sizes.split(',')]
+    except ValueError:
+        parser.error("--sizes must be a comma-separated list of integers")
+    # delete_churn menghapus DELETE_COUNT objek dari setiap scene
+    if min(args.sizes) <= DELETE_COUNT:
+        parser.error(f"every size in --sizes must be larger than {DELETE_COUNT}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.confirm < 0:
+        parser.error("--confirm must be at least 0")
+    if (args.baseline and args.save_baseline
+            and os.path.abspath(args.baseline) == os.path.abspath(args.save_baseline)):
+        parser.error("--baseline and --save-baseline must be different files")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = args.sizes
+    case_names = args.cases.split(',')
+    unknown = set(case_names) - set(CASE_FUNCS)
+    if unknown:
+        raise SystemExit(f"Unknown case(s): {', '.join(sorted(unknown))}")
+    if args.no_render and 'render' in case_names:
+        case_names.remove('render')
+
+    # Harus diatur sebelum OpenGL diimport (lewat main6)
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    if 'render' in case_names:
+        os.environ.setdefault('PYOPENGL_PLATFORM', 'egl')
+        os.environ.setdefault('EGL_PLATFORM', 'surfaceless')
+        os.environ.setdefault('LIBGL_ALWAYS_SOFTWARE', '1')
+    import main6
+
+    app = main6.GraphicsApp(create_window=False)
+    renderer = None
+    if 'render' in case_names:
+        from OpenGL.GL import glGetString, GL_RENDERER
+        create_software_context(app.width, app.height)
+        app.setup_viewport()
+        renderer = glGetString(GL_RENDERER).decode()
+        print(f"Software GL renderer: {renderer}")
+
+    results = {}
+    for size in sizes:
+        scene = generate_scene(size, args.seed, app.width, app.height)
+        for name, _ in CASES:
+            if name not in case_names or (name == 'render' and size > args.render_max_size):
+                continue
+            results[f"{name}[{size}]"] = run_case(main6, app, name, size, scene, args)
+
+    # Bandingkan dulu sebelum hasil dan baseline baru ditulis
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"Comparison with {args.baseline} "
+              f"(threshold {args.threshold:.0%}, noise factor {args.noise_factor:g}, "
+              f"min delta {args.min_delta * 1000:g} ms, "
+              f"baseline scaled by reference speed):")
+        regressions, missing = compare(results, baseline, args.threshold, args.noise_factor,
+                                       args.min_delta)
+
+        # Kasus yang tampak regresi diukur ulang; hanya yang tetap lambat dilaporkan
+        for attempt in range(args.confirm):
+            if not regressions:
+                break
+            print(f"Re-measuring {len(regressions)} case(s) ({attempt + 1}/{args.confirm}):")
+            for key in regressions:
+                previous = results[key]
+                scene = generate_scene(previous['size'], args.seed, app.width, app.height)
+                result = run_case(main6, app, previous['case'], previous['size'], scene, args)
+                if result['best_s'] / result['reference_s'] < previous['best_s'] / previous['reference_s']:
+                    results[key] = result
+            regressions, _ = compare(results, baseline, args.threshold, args.noise_factor,
+                                     args.min_delta, regressions)
+
+        if missing:
+            print(f"{len(missing)} baseline case(s) not run: {', '.join(missing)}")
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+            status = 1
+
+    report = {
+        'meta': {
+            'seed': args.seed,
+            'sizes': sizes,
+            'repeat': args.repeat,
+            'min_time': args.min_time,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'renderer': renderer,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
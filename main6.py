@@ -2,23 +2,70 @@ import pygame
 from pygame.locals import *
 from OpenGL.GL import *
 from OpenGL.GLU import *
+from collections import ChainMap
 import math
+import queue
+import sys
+import threading
+import time
+import traceback
 import numpy as np
 
+# Kode tipe objek untuk cache array geometri
+OBJECT_TYPE_CODES = {'point': 0, 'line': 1, 'rectangle': 2, 'ellipse': 3}
+
+# Jumlah transformasi berubah yang ditumpuk di atas base snapshot sebelum base dibuat ulang
+SNAPSHOT_DELTA_LIMIT = 64
+# Selang maksimum (detik) antar pengambilan event SDL selama menggambar frame
+EVENT_PUMP_INTERVAL = 0.01
+
+def copy_transformation(transform):
+    """Salinan satu entri transformasi (None menjadi transformasi identitas)"""
+    if transform is None:
+        return {'translation': [0, 0], 'rotation': 0, 'scale': 1.0}
+    return {
+        'translation': list(transform['translation']),
+        'rotation': transform['rotation'],
+        'scale': transform['scale']
+    }
+
+class SceneSnapshot:
+    """
+    State scene yang tidak diubah lagi setelah dibuat.
+    Dibuat oleh thread update dan hanya dibaca oleh thread render.
+    Biaya pembuatannya tidak bergantung pada jumlah objek (lihat
+    GraphicsApp.snapshot_transformations).
+    """
+    def __init__(self, app):
+        # self.objects hanya pernah ditambah di akhir (hapus/clear membuat list baru),
+        # jadi cukup simpan referensi list dan panjangnya saat ini
+        self.object_list = app.objects
+        self.object_count = len(app.objects)
+        self.object_transformations = app.snapshot_transformations()
+        self.selected_object = app.selected_object
+        self.window_bounds = list(app.window_bounds) if app.window_bounds else None
+        self.temp_points = list(app.temp_points)
+        self.current_tool = app.current_tool
+        self.current_color = list(app.current_color)
+        self.line_width = app.line_width
+        self.selection_mode = app.selection_mode
+        self.transform_mode = app.transform_mode
+    
+    @property
+    def objects(self):
+        return self.object_list[:self.object_count]
+
 class GraphicsApp:
-    def __init__(self):
-        # Inisialisasi pygame dan OpenGL
-        pygame.init()
+    def __init__(self, create_window=True):
         self.width, self.height = 800, 600
-        self.screen = pygame.display.set_mode((self.width, self.height), DOUBLEBUF | OPENGL)
-        pygame.display.set_caption("Aplikasi Grafika 2D Interaktif - PyOpenGL")
         
-        # Setup OpenGL viewport
-        glViewport(0, 0, self.width, self.height)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluOrtho2D(0, self.width, 0, self.height)
-        glMatrixMode(GL_MODELVIEW)
+        # Inisialisasi pygame dan OpenGL
+        # (create_window=False dipakai benchmark yang menyediakan konteks GL sendiri)
+        if create_window:
+            pygame.init()
+            self.screen = pygame.display.set_mode((self.width, self.height), DOUBLEBUF | OPENGL)
+            pygame.display.set_caption("Aplikasi Grafika 2D Interaktif - PyOpenGL")
+            self.setup_viewport()
         
         # State variables
         self.current_tool = 'point'  # point, line, rectangle, ellipse
@@ -35,88 +82,287 @@ class GraphicsApp:
         # Transformation parameters untuk objek yang dipilih
         self.object_transformations = {}  # Dictionary untuk menyimpan transformasi per objek
         
+        # Cache array NumPy geometri dan transformasi untuk hit-testing
+        self.rebuild_geometry_cache()
+        
+        # Thread update memproses event dari antrian dan menerbitkan snapshot scene.
+        # Thread utama (pemilik window dan konteks GL) hanya merender snapshot terakhir.
+        self.event_queue = queue.Queue()
+        self.running = False
+        self.next_event_pump = 0.0
+        self.snapshot_lock = threading.Lock()
+        self.snapshot_base = {}
+        self.snapshot_base_source = None
+        self.changed_transformations = set()
+        self.snapshot = SceneSnapshot(self)
+        
+    def setup_viewport(self):
+        """Setup OpenGL viewport dan proyeksi 2D"""
+        glViewport(0, 0, self.width, self.height)
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        gluOrtho2D(0, self.width, 0, self.height)
+        glMatrixMode(GL_MODELVIEW)
+    
     def screen_to_opengl(self, x, y):
         """Konversi koordinat layar pygame ke koordinat OpenGL"""
         return x, self.height - y
     
-    def distance_point_to_point(self, p1, p2):
-        """Hitung jarak antara dua titik"""
-        return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
-    
-    def distance_point_to_line(self, px, py, x1, y1, x2, y2):
-        """Hitung jarak dari titik ke garis"""
-        # Rumus jarak titik ke garis: |ax + by + c| / sqrt(a² + b²)
-        A = y2 - y1
-        B = x1 - x2
-        C = x2 * y1 - x1 * y2
-        
-        distance = abs(A * px + B * py + C) / math.sqrt(A * A + B * B)
-        
-        # Cek apakah proyeksi titik berada dalam segmen garis
-        dot_product = (px - x1) * (x2 - x1) + (py - y1) * (y2 - y1)
-        squared_length = (x2 - x1) * (x2 - x1) + (y2 - y1) * (y2 - y1)
-        
-        if squared_length == 0:
-            return self.distance_point_to_point((px, py), (x1, y1))
-        
-        t = dot_product / squared_length
-        
-        if t < 0:
-            return self.distance_point_to_point((px, py), (x1, y1))
-        elif t > 1:
-            return self.distance_point_to_point((px, py), (x2, y2))
-        else:
-            return distance
-    
     def point_in_rectangle(self, px, py, x1, y1, x2, y2):
         """Cek apakah titik berada dalam rectangle"""
         min_x, max_x = min(x1, x2), max(x1, x2)
         min_y, max_y = min(y1, y2), max(y1, y2)
         return min_x <= px <= max_x and min_y <= py <= max_y
     
+    @staticmethod
+    def geometry_points_of(obj):
+        """Dua titik geometri objek (objek titik diduplikasi, centroid tetap sama)"""
+        return obj['points'][:1] * 2 if obj['type'] == 'point' else obj['points'][:2]
+    
+    def rebuild_geometry_cache(self):
+        """
+        Bangun ulang cache array geometri (tipe, titik) dan transformasi
+        (translasi, rotasi, skala) untuk semua objek. Handler memperbarui cache
+        secara inkremental; rebuild penuh hanya terjadi jika objects atau
+        object_transformations diganti dari luar handler.
+        """
+        n = len(self.objects)
+        capacity = max(16, n)
+        self.geometry_types = np.zeros(capacity, dtype=np.int8)
+        self.geometry_points = np.zeros((capacity, 2, 2))
+        self.geometry_translation = np.zeros((capacity, 2))
+        self.geometry_rotation = np.zeros(capacity)
+        self.geometry_scale = np.ones(capacity)
+        self.geometry_transformed = np.zeros((capacity, 2, 2))
+        if n:
+            self.geometry_types[:n] = [OBJECT_TYPE_CODES[obj['type']] for obj in self.objects]
+            self.geometry_points[:n] = [self.geometry_points_of(obj) for obj in self.objects]
+        self.geometry_count = n
+        self.geometry_objects = self.objects
+        self.geometry_transformations = self.object_transformations
+        for obj_idx, transform in self.object_transformations.items():
+            if obj_idx < n:
+                self.geometry_translation[obj_idx] = transform['translation']
+                self.geometry_rotation[obj_idx] = transform['rotation']
+                self.geometry_scale[obj_idx] = transform['scale']
+        self.geometry_transformed[:n] = self.transform_geometry(slice(0, n))
+    
+    def geometry_cache_valid(self):
+        """Cek apakah cache geometri masih sesuai dengan objects/object_transformations"""
+        return (self.geometry_objects is self.objects
+                and self.geometry_transformations is self.object_transformations
+                and self.geometry_count == len(self.objects))
+    
+    def add_object(self, obj):
+        """Tambahkan objek dan baris cache geometrinya"""
+        cache_valid = self.geometry_cache_valid()
+        self.objects.append(obj)
+        if not cache_valid:
+            return
+        
+        n = self.geometry_count
+        if n == len(self.geometry_types):
+            # Kapasitas digandakan agar penambahan tetap O(1) amortisasi
+            grow = max(16, n)
+            self.geometry_types = np.concatenate([self.geometry_types, np.zeros(grow, dtype=np.int8)])
+            self.geometry_points = np.concatenate([self.geometry_points, np.zeros((grow, 2, 2))])
+            self.geometry_translation = np.concatenate([self.geometry_translation, np.zeros((grow, 2))])
+            self.geometry_rotation = np.concatenate([self.geometry_rotation, np.zeros(grow)])
+            self.geometry_scale = np.concatenate([self.geometry_scale, np.ones(grow)])
+            self.geometry_transformed = np.concatenate([self.geometry_transformed, np.zeros((grow, 2, 2))])
+        self.geometry_types[n] = OBJECT_TYPE_CODES[obj['type']]
+        self.geometry_points[n] = self.geometry_points_of(obj)
+        self.geometry_count = n + 1
+        self.update_geometry_transformation(n)
+    
+    def transformation_changed(self, obj_index):
+        """
+        Catat perubahan transformasi satu objek dan perbarui cache geometri.
+        Wajib dipanggil setelah dict dari get_object_transformation diubah
+        langsung; tanpa itu pemilihan objek memakai geometri lama. Gunakan
+        modify_transformation/reset_transformation agar ini otomatis.
+        """
+        self.changed_transformations.add(obj_index)
+        self.update_geometry_transformation(obj_index)
+    
+    def update_geometry_transformation(self, obj_index):
+        """Salin transformasi satu objek ke cache geometri"""
+        if not self.geometry_cache_valid():
+            return
+        transform = self.object_transformations.get(obj_index)
+        if transform is None:
+            self.geometry_translation[obj_index] = 0
+            self.geometry_rotation[obj_index] = 0
+            self.geometry_scale[obj_index] = 1.0
+        else:
+            self.geometry_translation[obj_index] = transform['translation']
+            self.geometry_rotation[obj_index] = transform['rotation']
+            self.geometry_scale[obj_index] = transform['scale']
+        self.geometry_transformed[obj_index] = self.transform_geometry(obj_index)
+    
+    def delete_geometry(self, obj_index):
+        """Geser baris cache setelah objek obj_index dihapus (dipanggil setelah penghapusan)"""
+        n = self.geometry_count
+        for array in (self.geometry_types, self.geometry_points, self.geometry_translation,
+                      self.geometry_rotation, self.geometry_scale, self.geometry_transformed):
+            array[obj_index:n - 1] = array[obj_index + 1:n]
+        self.geometry_count = n - 1
+        self.geometry_objects = self.objects
+        self.geometry_transformations = self.object_transformations
+    
+    def transform_geometry(self, rows):
+        """
+        Hitung titik hasil transformasi untuk baris cache tertentu (index atau slice).
+        Rumus sama dengan apply_transformation_to_object:
+        p' = c + t + s * R(p - c), c = centroid titik asli
+        """
+        points = self.geometry_points[rows].reshape(-1, 2, 2)
+        translation = self.geometry_translation[rows].reshape(-1, 2)
+        rotation = self.geometry_rotation[rows].reshape(-1)
+        scale = self.geometry_scale[rows].reshape(-1)
+        
+        center = points.mean(axis=1, keepdims=True)
+        angle = np.radians(rotation)[:, None]
+        cos_a, sin_a = np.cos(angle), np.sin(angle)
+        rel_x = points[..., 0] - center[..., 0]
+        rel_y = points[..., 1] - center[..., 1]
+        rotated = np.stack((rel_x * cos_a - rel_y * sin_a,
+                            rel_x * sin_a + rel_y * cos_a), axis=-1)
+        transformed = center + translation[:, None, :] + scale[:, None, None] * rotated
+        return transformed.reshape(self.geometry_points[rows].shape)
+    
+    def get_transformed_geometry(self):
+        """
+        Geometri semua objek setelah transformasi, langsung dari cache array.
+        Hasil: (types, points) dengan types berisi OBJECT_TYPE_CODES dan
+        points berbentuk (N, 2, 2).
+        """
+        if not self.geometry_cache_valid():
+            self.rebuild_geometry_cache()
+        n = self.geometry_count
+        return self.geometry_types[:n], self.geometry_transformed[:n]
+    
+    @staticmethod
+    def distances_to_segments(px, py, x1, y1, x2, y2):
+        """Jarak (vektor) dari titik (px, py) ke banyak segmen garis sekaligus"""
+        dx, dy = x2 - x1, y2 - y1
+        squared_length = dx * dx + dy * dy
+        safe_length = np.where(squared_length > 0, squared_length, 1.0)
+        # Proyeksi dibatasi ke [0, 1] agar tetap berada di dalam segmen
+        t = np.clip(((px - x1) * dx + (py - y1) * dy) / safe_length, 0.0, 1.0)
+        t = np.where(squared_length > 0, t, 0.0)
+        return np.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+    
+    @staticmethod
+    def distances_to_ellipses(px, py, cx, cy, rx, ry, iterations=60):
+        """
+        Jarak euclid (vektor) dari titik (px, py) ke keliling banyak ellipse
+        sejajar sumbu. Memakai metode bisection Eberly ("Distance from a Point
+        to an Ellipse") dengan jumlah iterasi tetap supaya bisa divektorisasi.
+        """
+        # Kerja di kuadran pertama dengan sumbu mayor e0 >= e1
+        qx, qy = np.abs(px - cx), np.abs(py - cy)
+        swap = ry > rx
+        e0, e1 = np.where(swap, ry, rx), np.where(swap, rx, ry)
+        y0, y1 = np.where(swap, qy, qx), np.where(swap, qx, qy)
+        distance = np.empty(e0.shape)
+        
+        # Ellipse degenerate menjadi segmen [-e0, e0] pada sumbu mayor
+        flat = e1 <= 0
+        distance[flat] = np.hypot(np.maximum(y0[flat] - e0[flat], 0.0), y1[flat])
+        
+        # Titik di sumbu minor
+        on_minor = ~flat & (y1 > 0) & (y0 <= 0)
+        distance[on_minor] = np.abs(y1[on_minor] - e1[on_minor])
+        
+        # Titik di sumbu mayor
+        on_major = ~flat & (y1 <= 0)
+        if on_major.any():
+            a, b, q = e0[on_major], e1[on_major], y0[on_major]
+            numer = a * q
+            denom = a * a - b * b
+            inside = numer < denom
+            xde = np.where(inside, numer / np.where(denom > 0, denom, 1.0), 1.0)
+            distance[on_major] = np.where(
+                inside,
+                np.hypot(a * xde - q, b * np.sqrt(np.maximum(1.0 - xde * xde, 0.0))),
+                np.abs(q - a))
+        
+        # Kasus umum: cari akar G(s) = (r0*z0/(s+r0))^2 + (z1/(s+1))^2 - 1
+        general = ~flat & (y1 > 0) & (y0 > 0)
+        if general.any():
+            a, b = e0[general], e1[general]
+            q0, q1 = y0[general], y1[general]
+            z0, z1 = q0 / a, q1 / b
+            g = z0 * z0 + z1 * z1 - 1
+            r0 = (a / b) ** 2
+            n0 = r0 * z0
+            s0 = z1 - 1
+            s1 = np.where(g < 0, 0.0, np.hypot(n0, z1) - 1)
+            for _ in range(iterations):
+                s = (s0 + s1) / 2
+                gs = (n0 / (s + r0)) ** 2 + (z1 / (s + 1)) ** 2 - 1
+                s0 = np.where(gs > 0, s, s0)
+                s1 = np.where(gs > 0, s1, s)
+            s = (s0 + s1) / 2
+            distance[general] = np.hypot(r0 * q0 / (s + r0) - q0, q1 / (s + 1) - q1)
+        
+        return distance
+    
     def find_object_at_point(self, x, y):
-        """Cari objek yang berada di dekat titik klik"""
+        """
+        Cari objek yang berada di dekat titik klik.
+        Semua objek diuji sekaligus terhadap geometri yang sudah ditransformasi,
+        memakai jarak sebenarnya ke bentuk (bukan galat persamaan ellipse).
+        """
         tolerance = 10  # Toleransi untuk seleksi
         
-        for i, obj in enumerate(reversed(self.objects)):  # Cek dari objek teratas
-            actual_index = len(self.objects) - 1 - i
-            
-            if obj['type'] == 'point':
-                px, py = obj['points'][0]
-                if self.distance_point_to_point((x, y), (px, py)) <= tolerance:
-                    return actual_index
-            
-            elif obj['type'] == 'line':
-                x1, y1, x2, y2 = obj['points'][0][0], obj['points'][0][1], obj['points'][1][0], obj['points'][1][1]
-                if self.distance_point_to_line(x, y, x1, y1, x2, y2) <= tolerance:
-                    return actual_index
-            
-            elif obj['type'] == 'rectangle':
-                x1, y1, x2, y2 = obj['points'][0][0], obj['points'][0][1], obj['points'][1][0], obj['points'][1][1]
-                # Cek apakah titik dekat dengan salah satu sisi rectangle
-                if (self.distance_point_to_line(x, y, x1, y1, x2, y1) <= tolerance or
-                    self.distance_point_to_line(x, y, x2, y1, x2, y2) <= tolerance or
-                    self.distance_point_to_line(x, y, x2, y2, x1, y2) <= tolerance or
-                    self.distance_point_to_line(x, y, x1, y2, x1, y1) <= tolerance):
-                    return actual_index
-            
-            elif obj['type'] == 'ellipse':
-                # Untuk ellipse, cek apakah titik berada dalam bounding rectangle
-                x1, y1, x2, y2 = obj['points'][0][0], obj['points'][0][1], obj['points'][1][0], obj['points'][1][1]
-                cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
-                rx, ry = abs(x2 - x1) / 2, abs(y2 - y1) / 2
-                
-                # Rumus ellipse: (x-cx)²/rx² + (y-cy)²/ry² = 1
-                # Cek apakah titik dekat dengan ellipse
-                if rx > 0 and ry > 0:
-                    ellipse_eq = ((x - cx)**2 / rx**2) + ((y - cy)**2 / ry**2)
-                    if abs(ellipse_eq - 1) <= 0.3:  # Toleransi untuk ellipse
-                        return actual_index
-        
-        return None
+        if not self.objects:
+            return None
+        
+        types, points = self.get_transformed_geometry()
+        x1, y1 = points[:, 0, 0], points[:, 0, 1]
+        x2, y2 = points[:, 1, 0], points[:, 1, 1]
+        distance = np.full(len(types), np.inf)
+        
+        # Titik dianggap segmen dengan panjang nol
+        segment = (types == OBJECT_TYPE_CODES['point']) | (types == OBJECT_TYPE_CODES['line'])
+        distance[segment] = self.distances_to_segments(
+            x, y, x1[segment], y1[segment], x2[segment], y2[segment])
+        
+        # Rectangle: jarak minimum ke keempat sisi (sama seperti draw_rectangle)
+        rectangle = types == OBJECT_TYPE_CODES['rectangle']
+        if rectangle.any():
+            ax, ay, bx, by = x1[rectangle], y1[rectangle], x2[rectangle], y2[rectangle]
+            distance[rectangle] = np.minimum.reduce([
+                self.distances_to_segments(x, y, ax, ay, bx, ay),
+                self.distances_to_segments(x, y, bx, ay, bx, by),
+                self.distances_to_segments(x, y, bx, by, ax, by),
+                self.distances_to_segments(x, y, ax, by, ax, ay),
+            ])
+        
+        # Ellipse: pusat dan radius dihitung seperti di render.
+        # Jarak eksak hanya dihitung jika klik berada di bounding box + toleransi
+        ellipse = ((types == OBJECT_TYPE_CODES['ellipse'])
+                   & (np.minimum(x1, x2) - tolerance <= x) & (x <= np.maximum(x1, x2) + tolerance)
+                   & (np.minimum(y1, y2) - tolerance <= y) & (y <= np.maximum(y1, y2) + tolerance))
+        if ellipse.any():
+            ax, ay, bx, by = x1[ellipse], y1[ellipse], x2[ellipse], y2[ellipse]
+            distance[ellipse] = self.distances_to_ellipses(
+                x, y, (ax + bx) / 2, (ay + by) / 2, np.abs(bx - ax) / 2, np.abs(by - ay) / 2)
+        
+        # Cek dari objek teratas
+        hits = np.flatnonzero(distance <= tolerance)
+        if hits.size == 0:
+            return None
+        return int(hits[-1])
     
     def get_object_transformation(self, obj_index):
-        """Dapatkan transformasi untuk objek tertentu"""
+        """
+        Dapatkan transformasi untuk objek tertentu. Dict yang dikembalikan
+        adalah data asli: jika diubah langsung, panggil transformation_changed
+        (atau pakai modify_transformation) agar cache geometri ikut berubah.
+        """
         if obj_index not in self.object_transformations:
             self.object_transformations[obj_index] = {
                 'translation': [0, 0],
@@ -125,6 +371,21 @@ class GraphicsApp:
             }
         return self.object_transformations[obj_index]
     
+    def modify_transformation(self, obj_index, translation=(0, 0), rotation=0, scale=1.0):
+        """Tambahkan translasi/rotasi dan kalikan skala objek, lalu perbarui cache"""
+        transform = self.get_object_transformation(obj_index)
+        transform['translation'][0] += translation[0]
+        transform['translation'][1] += translation[1]
+        transform['rotation'] += rotation
+        transform['scale'] *= scale
+        self.transformation_changed(obj_index)
+    
+    def reset_transformation(self, obj_index):
+        """Hapus transformasi objek, lalu perbarui cache"""
+        if obj_index in self.object_transformations:
+            del self.object_transformations[obj_index]
+            self.transformation_changed(obj_index)
+    
     def draw_point(self, x, y, color, size=5):
         """Menggambar titik"""
         glColor3f(*color)
@@ -169,12 +430,14 @@ class GraphicsApp:
             glVertex2f(x, y)
         glEnd()
     
-    def apply_transformation_to_object(self, obj, obj_index):
+    def apply_transformation_to_object(self, obj, obj_index, transformations=None):
         """Menerapkan transformasi geometri pada objek tertentu"""
-        if obj_index not in self.object_transformations:
+        if transformations is None:
+            transformations = self.object_transformations
+        if obj_index not in transformations:
             return obj['points']
         
-        transform = self.object_transformations[obj_index]
+        transform = transformations[obj_index]
         translation = transform['translation']
         rotation = transform['rotation']
         scale = transform['scale']
@@ -214,9 +477,9 @@ class GraphicsApp:
         
         return transformed_points
     
-    def draw_selection_highlight(self, obj, obj_index):
+    def draw_selection_highlight(self, obj, obj_index, transformations=None):
         """Gambar highlight untuk objek yang dipilih"""
-        points = self.apply_transformation_to_object(obj, obj_index)
+        points = self.apply_transformation_to_object(obj, obj_index, transformations)
         
         glColor3f(1.0, 1.0, 0.0)  # Yellow highlight
         glLineWidth(3)
@@ -314,17 +577,21 @@ class GraphicsApp:
                 x2, y2 = x, y
                 code2 = compute_code(x2, y2)
     
-    def point_in_window(self, x, y):
+    def point_in_window(self, x, y, window_bounds=None):
         """Cek apakah titik berada dalam window"""
-        if not self.window_bounds:
+        if window_bounds is None:
+            window_bounds = self.window_bounds
+        if not window_bounds:
             return False
-        xmin, ymin, xmax, ymax = self.window_bounds
+        xmin, ymin, xmax, ymax = window_bounds
         return xmin <= x <= xmax and ymin <= y <= ymax
     
-    def draw_window(self):
+    def draw_window(self, window_bounds=None):
         """Menggambar window clipping"""
-        if self.window_bounds:
-            x1, y1, x2, y2 = self.window_bounds
+        if window_bounds is None:
+            window_bounds = self.window_bounds
+        if window_bounds:
+            x1, y1, x2, y2 = window_bounds
             glColor3f(1.0, 1.0, 0.0)  # Yellow
             glLineWidth(2)
             glBegin(GL_LINE_LOOP)
@@ -334,27 +601,34 @@ class GraphicsApp:
             glVertex2f(x1, y2)
             glEnd()
     
-    def render(self):
-        """Render semua objek"""
+    def draw_scene(self, scene, pump_events=False):
+        """
+        Gambar semua objek dari snapshot scene ke konteks GL aktif.
+        Dengan pump_events, event SDL diteruskan ke thread update di sela-sela
+        objek sehingga frame yang berat tidak menunda input.
+        """
         glClear(GL_COLOR_BUFFER_BIT)
         
         # Gambar semua objek
-        for i, obj in enumerate(self.objects):
+        for i, obj in enumerate(scene.objects):
+            if pump_events and time.perf_counter() >= self.next_event_pump:
+                self.forward_events()
+            
             color = obj['color']
             
             # Terapkan transformasi pada objek
-            points = self.apply_transformation_to_object(obj, i)
+            points = self.apply_transformation_to_object(obj, i, scene.object_transformations)
             
             # Cek apakah objek dalam window (untuk perubahan warna)
-            if self.window_bounds:
+            if scene.window_bounds:
                 in_window = False
                 if obj['type'] == 'point':
                     x, y = points[0]
-                    in_window = self.point_in_window(x, y)
+                    in_window = self.point_in_window(x, y, scene.window_bounds)
                 elif obj['type'] == 'line':
                     # Cek apakah salah satu titik dalam window
                     for x, y in points:
-                        if self.point_in_window(x, y):
+                        if self.point_in_window(x, y, scene.window_bounds):
                             in_window = True
                             break
                 
@@ -366,10 +640,10 @@ class GraphicsApp:
             if obj['type'] == 'point':
                 self.draw_point(points[0][0], points[0][1], color)
             elif obj['type'] == 'line':
-                if self.window_bounds:
+                if scene.window_bounds:
                     # Terapkan clipping
                     x1, y1, x2, y2 = points[0][0], points[0][1], points[1][0], points[1][1]
-                    xmin, ymin, xmax, ymax = self.window_bounds
+                    xmin, ymin, xmax, ymax = scene.window_bounds
                     clipped, cx1, cy1, cx2, cy2 = self.cohen_sutherland_clip(
                         x1, y1, x2, y2, xmin, ymin, xmax, ymax)
                     if clipped:
@@ -386,39 +660,46 @@ class GraphicsApp:
                 self.draw_ellipse(cx, cy, rx, ry, color, obj['width'])
             
             # Gambar highlight jika objek dipilih
-            if self.selected_object == i:
-                self.draw_selection_highlight(obj, i)
+            if scene.selected_object == i:
+                self.draw_selection_highlight(obj, i, scene.object_transformations)
         
         # Gambar window clipping
-        self.draw_window()
+        if scene.window_bounds:
+            self.draw_window(scene.window_bounds)
         
         # Gambar objek sementara
-        if len(self.temp_points) == 1 and self.current_tool in ['line', 'rectangle', 'ellipse'] and not self.selection_mode:
+        if len(scene.temp_points) == 1 and scene.current_tool in ['line', 'rectangle', 'ellipse'] and not scene.selection_mode:
             mouse_pos = pygame.mouse.get_pos()
             mx, my = self.screen_to_opengl(*mouse_pos)
             
-            glColor3f(*self.current_color)
-            glLineWidth(self.line_width)
+            glColor3f(*scene.current_color)
+            glLineWidth(scene.line_width)
             
-            if self.current_tool == 'line':
+            if scene.current_tool == 'line':
                 glBegin(GL_LINES)
-                glVertex2f(self.temp_points[0][0], self.temp_points[0][1])
+                glVertex2f(scene.temp_points[0][0], scene.temp_points[0][1])
                 glVertex2f(mx, my)
                 glEnd()
-            elif self.current_tool == 'rectangle':
+            elif scene.current_tool == 'rectangle':
                 glBegin(GL_LINE_LOOP)
-                glVertex2f(self.temp_points[0][0], self.temp_points[0][1])
-                glVertex2f(mx, self.temp_points[0][1])
+                glVertex2f(scene.temp_points[0][0], scene.temp_points[0][1])
+                glVertex2f(mx, scene.temp_points[0][1])
                 glVertex2f(mx, my)
-                glVertex2f(self.temp_points[0][0], my)
+                glVertex2f(scene.temp_points[0][0], my)
                 glEnd()
+    
+    def render(self, scene=None, pump_events=False):
+        """Render semua objek dari snapshot scene (default: state aplikasi saat ini)"""
+        if scene is None:
+            scene = self
+        self.draw_scene(scene, pump_events)
         
         # Tampilkan status di title bar
-        status = f"Mode: {'SELECT' if self.selection_mode else self.current_tool.upper()}"
-        if self.selected_object is not None:
-            status += f" | Selected: Object {self.selected_object + 1}"
-        if self.transform_mode:
-            status += f" | Transform: {self.transform_mode.upper()}"
+        status = f"Mode: {'SELECT' if scene.selection_mode else scene.current_tool.upper()}"
+        if scene.selected_object is not None:
+            status += f" | Selected: Object {scene.selected_object + 1}"
+        if scene.transform_mode:
+            status += f" | Transform: {scene.transform_mode.upper()}"
         
         pygame.display.set_caption(f"Aplikasi Grafika 2D - {status}")
         pygame.display.flip()
@@ -456,7 +737,7 @@ class GraphicsApp:
                 'color': self.current_color.copy(),
                 'width': self.line_width
             }
-            self.objects.append(obj)
+            self.add_object(obj)
         
         elif self.current_tool in ['line', 'rectangle', 'ellipse']:
             self.temp_points.append((x, y))
@@ -467,7 +748,7 @@ class GraphicsApp:
                     'color': self.current_color.copy(),
                     'width': self.line_width
                 }
-                self.objects.append(obj)
+                self.add_object(obj)
                 self.temp_points = []
     
     def handle_keyboard(self, key):
@@ -519,47 +800,46 @@ class GraphicsApp:
             
             # Apply transformations to selected object
             elif self.transform_mode == 'translate':
-                transform = self.get_object_transformation(self.selected_object)
                 if key == K_UP:
-                    transform['translation'][1] += 10
+                    self.modify_transformation(self.selected_object, translation=(0, 10))
                 elif key == K_DOWN:
-                    transform['translation'][1] -= 10
+                    self.modify_transformation(self.selected_object, translation=(0, -10))
                 elif key == K_LEFT:
-                    transform['translation'][0] -= 10
+                    self.modify_transformation(self.selected_object, translation=(-10, 0))
                 elif key == K_RIGHT:
-                    transform['translation'][0] += 10
+                    self.modify_transformation(self.selected_object, translation=(10, 0))
             
             elif self.transform_mode == 'rotate':
-                transform = self.get_object_transformation(self.selected_object)
                 if key == K_q:
-                    transform['rotation'] += 5
+                    self.modify_transformation(self.selected_object, rotation=5)
                 elif key == K_e:
-                    transform['rotation'] -= 5
+                    self.modify_transformation(self.selected_object, rotation=-5)
             
             elif self.transform_mode == 'scale':
-                transform = self.get_object_transformation(self.selected_object)
                 if key == K_z:
-                    transform['scale'] *= 1.1
+                    self.modify_transformation(self.selected_object, scale=1.1)
                 elif key == K_x:
-                    transform['scale'] *= 0.9
+                    self.modify_transformation(self.selected_object, scale=0.9)
         
         # Reset transformations for selected object
         if key == K_BACKSPACE and self.selected_object is not None:
-            if self.selected_object in self.object_transformations:
-                del self.object_transformations[self.selected_object]
+            self.reset_transformation(self.selected_object)
             print("Reset transformations for selected object")
         
         # Clear all
         elif key == K_c:
             self.objects = []
             self.object_transformations = {}
+            self.rebuild_geometry_cache()
             self.selected_object = None
             self.window_bounds = None
         
         # Delete selected object
         elif key == K_DELETE and self.selected_object is not None:
-            # Hapus objek dan transformasinya
-            del self.objects[self.selected_object]
+            # Hapus objek dan transformasinya. List baru dibuat (bukan del in-place)
+            # karena snapshot yang sudah terbit memakai list lama bersama-sama
+            cache_valid = self.geometry_cache_valid()
+            self.objects = self.objects[:self.selected_object] + self.objects[self.selected_object + 1:]
             if self.selected_object in self.object_transformations:
                 del self.object_transformations[self.selected_object]
             
@@ -572,13 +852,92 @@ class GraphicsApp:
                     new_transformations[obj_idx] = transform
             
             self.object_transformations = new_transformations
+            if cache_valid:
+                self.delete_geometry(self.selected_object)
             self.selected_object = None
             print("Deleted selected object")
     
+    def snapshot_transformations(self):
+        """
+        Transformasi untuk snapshot, copy-on-write: base (salinan penuh) dipakai
+        bersama oleh banyak snapshot, dan hanya entri yang berubah sejak base
+        dibuat yang disalin ke layer di atasnya. Base dibuat ulang setelah
+        object_transformations diganti (hapus/clear) atau delta terlalu besar.
+        """
+        if (self.snapshot_base_source is not self.object_transformations
+                or len(self.changed_transformations) > SNAPSHOT_DELTA_LIMIT):
+            self.snapshot_base = {obj_idx: copy_transformation(transform)
+                                  for obj_idx, transform in self.object_transformations.items()}
+            self.snapshot_base_source = self.object_transformations
+            self.changed_transformations = set()
+        
+        # Entri yang direset ditutup dengan transformasi identitas
+        delta = {obj_idx: copy_transformation(self.object_transformations.get(obj_idx))
+                 for obj_idx in self.changed_transformations}
+        return ChainMap(delta, self.snapshot_base)
+    
+    def publish_snapshot(self):
+        """Terbitkan snapshot baru (double buffer: render tetap memakai snapshot lama sampai diganti)"""
+        snapshot = SceneSnapshot(self)
+        with self.snapshot_lock:
+            self.snapshot = snapshot
+    
+    def get_snapshot(self):
+        """Ambil snapshot terakhir untuk dirender"""
+        with self.snapshot_lock:
+            return self.snapshot
+    
+    def forward_events(self):
+        """Ambil event SDL dan teruskan ke antrian thread update"""
+        for event in pygame.event.get():
+            if event.type == QUIT:
+                self.running = False
+            elif event.type == MOUSEBUTTONDOWN:
+                if event.button == 1:  # Left click
+                    self.event_queue.put(('click', event.pos))
+            elif event.type == KEYDOWN:
+                self.event_queue.put(('key', event.key))
+        self.next_event_pump = time.perf_counter() + EVENT_PUMP_INTERVAL
+    
+    def process_event(self, event):
+        """Jalankan handler untuk satu event dari antrian"""
+        kind, value = event
+        try:
+            if kind == 'click':
+                self.handle_mouse_click(value)
+            elif kind == 'key':
+                self.handle_keyboard(value)
+        except Exception:
+            # Satu event yang gagal tidak boleh mematikan thread update
+            print(f"Error while handling {kind} event {value!r}:", file=sys.stderr)
+            traceback.print_exc()
+    
+    def update_loop(self):
+        """
+        Thread update: satu-satunya yang mengubah state scene.
+        Semua event yang menumpuk diproses dulu, lalu satu snapshot diterbitkan,
+        sehingga burst key repeat tidak membuat snapshot per event.
+        """
+        while True:
+            event = self.event_queue.get()
+            if event is None:
+                return
+            self.process_event(event)
+            while True:
+                try:
+                    event = self.event_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event is None:
+                    self.publish_snapshot()
+                    return
+                self.process_event(event)
+            self.publish_snapshot()
+    
     def run(self):
         """Main game loop"""
         clock = pygame.time.Clock()
-        running = True
+        self.running = True
         
         print("=== KONTROL APLIKASI ===")
         print("Selection: V = Toggle selection mode")
@@ -597,19 +956,22 @@ class GraphicsApp:
         print("Clear All: C")
         print("========================")
         
-        while running:
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    running = False
-                elif event.type == MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left click
-                        self.handle_mouse_click(event.pos)
-                elif event.type == KEYDOWN:
-                    self.handle_keyboard(event.key)
+        # Event SDL harus diambil di thread pemilik window, jadi thread utama
+        # hanya meneruskan event ke antrian; handler berjalan di thread update
+        update_thread = threading.Thread(target=self.update_loop, name="scene-update", daemon=True)
+        update_thread.start()
+        
+        while self.running:
+            self.forward_events()
+            if not update_thread.is_alive():
+                print("Scene update thread stopped, exiting", file=sys.stderr)
+                break
             
-            self.render()
+            self.render(self.get_snapshot(), pump_events=True)
             clock.tick(60)
         
+        self.event_queue.put(None)
+        update_thread.join()
         pygame.quit()
 
 if __name__ == "__main__":